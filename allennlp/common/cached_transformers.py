@@ -130,7 +130,8 @@ _tokenizer_cache: Dict[Tuple[str, str], transformers.PreTrainedTokenizer] = {}
 def get_tokenizer(model_name: str, **kwargs) -> transformers.PreTrainedTokenizer:
     from allennlp.common.util import hash_object
 
-    cache_key = (model_name, hash_object(kwargs))
+    # Sort the kwargs, so that the same arguments passed in a different order still hit the cache.
+    cache_key = (model_name, hash_object(sorted(kwargs.items())))
 
     global _tokenizer_cache
     tokenizer = _tokenizer_cache.get(cache_key, None)
@@ -65,6 +65,10 @@ CACHE_ROOT = Path(os.getenv("ALLENNLP_CACHE_ROOT", Path.home() / ".allennlp"))
 CACHE_DIRECTORY = str(CACHE_ROOT / "cache")
 DEPRECATED_CACHE_DIRECTORY = str(CACHE_ROOT / "datasets")
 
+# If this is set, `cached_path()` will use an existing cached copy of a remote resource
+# without first asking the remote server whether the resource has changed.
+PREFER_CACHED = bool(os.environ.get("ALLENNLP_PREFER_CACHED"))
+
 # This variable was deprecated in 0.7.2 since we use a single folder for caching
 # all types of files (datasets, models, etc.)
 DATASET_CACHE = CACHE_DIRECTORY
@@ -539,7 +543,8 @@ def _http_get(url: str, temp_file: IO) -> None:
         content_length = req.headers.get("Content-Length")
         total = int(content_length) if content_length is not None else None
         progress = Tqdm.tqdm(unit="B", total=total, desc="downloading")
-        for chunk in req.iter_content(chunk_size=1024):
+        # Large chunks keep the per-chunk Python and progress bar overhead low on big downloads.
+        for chunk in req.iter_content(chunk_size=1024 * 1024):
             if chunk:  # filter out keep-alive new chunks
                 progress.update(len(chunk))
                 temp_file.write(chunk)
@@ -988,6 +993,12 @@ def get_from_cache(url: str, cache_dir: Union[str, Path] = None) -> str:
         else:
             return _hf_hub_download(url, identifier, None, cache_dir)
 
+    if PREFER_CACHED:
+        latest_cached = _find_latest_cached(url, cache_dir)
+        if latest_cached:
+            logger.info("Using cached version of %s without checking for updates", url)
+            return latest_cached
+
     # Get eTag to add to filename, if it exists.
     try:
         if url.startswith("s3://"):
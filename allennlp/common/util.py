@@ -529,6 +529,22 @@ def is_global_primary() -> bool:
         return dist.get_rank() == 0
 
 
+def is_local_primary() -> bool:
+    """
+    Checks if the distributed process group is the primary of its node (local rank = 0).
+    If the distributed process group is not available or has not been initialized,
+    this trivially returns `True`.
+    """
+    if not is_distributed():
+        return True
+    if "LOCAL_RANK" in os.environ:
+        # Set by `torch.distributed.launch` and `torchrun`.
+        return int(os.environ["LOCAL_RANK"]) == 0
+    # Set by `allennlp train` for distributed training.
+    num_procs_per_node = int(os.environ.get("ALLENNLP_PROCS_PER_NODE", dist.get_world_size()))
+    return dist.get_rank() % num_procs_per_node == 0
+
+
 def sanitize_wordpiece(wordpiece: str) -> str:
     """
     Sanitizes wordpieces from BERT, RoBERTa or ALBERT tokenizers.
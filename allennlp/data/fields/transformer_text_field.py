@@ -9,9 +9,9 @@ from allennlp.nn import util
 
 
 def _tensorize(x: Union[torch.Tensor, List[int]]) -> torch.Tensor:
-    if not isinstance(x, torch.Tensor):
-        return torch.tensor(x)
-    return x
+    # `as_tensor()` shares memory with numpy arrays, like the ones huggingface tokenizers return
+    # with `return_tensors="np"`, instead of copying them.
+    return torch.as_tensor(x)
 
 
 class TransformerTextField(Field[torch.Tensor]):
@@ -44,7 +44,13 @@ class TransformerTextField(Field[torch.Tensor]):
     ) -> None:
         self.input_ids = _tensorize(input_ids)
         self.token_type_ids = None if token_type_ids is None else _tensorize(token_type_ids)
-        self.attention_mask = None if attention_mask is None else _tensorize(attention_mask)
+        self.attention_mask: Optional[torch.Tensor] = None
+        if attention_mask is not None:
+            attention_mask = _tensorize(attention_mask).bool()
+            # A mask that covers every token carries no information, since `as_tensor()` can
+            # rebuild it from the length of `input_ids`, so we don't keep it around.
+            if attention_mask.shape[-1] != self.input_ids.shape[-1] or not attention_mask.all():
+                self.attention_mask = attention_mask
         self.special_tokens_mask = (
             None if special_tokens_mask is None else _tensorize(special_tokens_mask)
         )
@@ -53,29 +59,45 @@ class TransformerTextField(Field[torch.Tensor]):
 
     @overrides
     def get_padding_lengths(self) -> Dict[str, int]:
-        return {
+        padding_lengths = {
             name: getattr(self, name).shape[-1]
             for name in self.__slots__
             if isinstance(getattr(self, name), torch.Tensor)
         }
+        # `as_tensor()` always produces an attention mask, even when we don't store one, so we
+        # always report its length. Otherwise a batch that mixes fields with and without a stored
+        # mask would get inconsistent padding lengths.
+        padding_lengths.setdefault("attention_mask", self.input_ids.shape[-1])
+        return padding_lengths
 
     @overrides
     def as_tensor(self, padding_lengths: Dict[str, int]) -> Dict[str, torch.Tensor]:
+        """
+        Tensors that already have the requested length are returned without a copy, so they
+        share memory with this field (and with any numpy array the field was created from).
+        Don't modify the returned tensors in place.
+        """
         result = {}
         for name, padding_length in padding_lengths.items():
             tensor = getattr(self, name)
+            if tensor is None and name == "attention_mask":
+                # We don't store masks that cover every token, so we rebuild the mask here.
+                result[name] = torch.arange(padding_length) < self.input_ids.shape[-1]
+                continue
             if len(tensor.shape) > 1:
                 tensor = tensor.squeeze(0)
-            result[name] = torch.nn.functional.pad(
-                tensor,
-                (0, padding_length - tensor.shape[-1]),
-                value=self.padding_token_id if name == "input_ids" else 0,
-            )
+            # The longest instance in a batch (and with bucketed batches, often many others)
+            # needs no padding, so we skip the copy that `pad()` would make.
+            if tensor.shape[-1] != padding_length:
+                tensor = torch.nn.functional.pad(
+                    tensor,
+                    (0, padding_length - tensor.shape[-1]),
+                    value=self.padding_token_id if name == "input_ids" else 0,
+                )
+            result[name] = tensor
         if "attention_mask" not in result:
-            result["attention_mask"] = torch.tensor(
-                [True] * self.input_ids.shape[-1]
-                + [False] * (padding_lengths["input_ids"] - self.input_ids.shape[-1]),
-                dtype=torch.bool,
+            result["attention_mask"] = (
+                torch.arange(padding_lengths["input_ids"]) < self.input_ids.shape[-1]
             )
         return result
 
@@ -109,8 +131,11 @@ class TransformerTextField(Field[torch.Tensor]):
                     + "]"
                 )
 
+        tensors = {name: getattr(self, name) for name in self.__slots__}
+        if tensors["attention_mask"] is None:
+            tensors["attention_mask"] = torch.ones(self.input_ids.shape[-1], dtype=torch.bool)
         return {
-            name: readable_tensor(getattr(self, name))
-            for name in self.__slots__
-            if isinstance(getattr(self, name), torch.Tensor)
+            name: readable_tensor(tensor)
+            for name, tensor in tensors.items()
+            if isinstance(tensor, torch.Tensor)
         }
@@ -1,12 +1,12 @@
 import copy
 import dataclasses
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Iterable
+from typing import Any, Dict, List, Optional, Set, Tuple, Iterable
 
 from overrides import overrides
 from transformers import PreTrainedTokenizer
 
-from allennlp.common.util import sanitize_wordpiece
+from allennlp.common.util import lazy_groups_of, sanitize_wordpiece
 from allennlp.data.tokenizers.token_class import Token
 from allennlp.data.tokenizers.tokenizer import Tokenizer
 
@@ -47,6 +47,8 @@ class PretrainedTransformerTokenizer(Tokenizer):
         for `AutoTokenizer.from_pretrained`.
     """  # noqa: E501
 
+    _BATCH_ENCODE_SIZE = 8192
+
     def __init__(
         self,
         model_name: str,
@@ -222,34 +224,84 @@ class PretrainedTransformerTokenizer(Tokenizer):
         detokenized = " ".join(tokenized)
         return "a" in detokenized
 
+    def _encode_plus_kwargs(self) -> Dict[str, Any]:
+        max_length = self._max_length
+        if max_length is not None and not self._add_special_tokens:
+            max_length += self.num_special_tokens_for_sequence()
+
+        return {
+            "add_special_tokens": True,
+            "max_length": max_length,
+            "truncation": True if max_length is not None else False,
+            "return_tensors": None,
+            "return_offsets_mapping": self.tokenizer.is_fast,
+            "return_attention_mask": False,
+            "return_token_type_ids": True,
+            "return_special_tokens_mask": True,
+        }
+
+    @overrides
+    def batch_tokenize(self, texts: List[str]) -> List[List[Token]]:
+        """
+        Tokenizes several texts using the batched interface of the huggingface tokenizer.
+
+        Identical texts are only encoded once, but every occurrence of a text gets its own
+        `Token` objects, just like with `tokenize()`. Large inputs are encoded in
+        chunks of `_BATCH_ENCODE_SIZE` texts. If the underlying tokenizer is a "fast" (Rust)
+        tokenizer, each chunk is encoded in parallel, subject to the `TOKENIZERS_PARALLELISM`
+        environment variable.
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        tokens_by_text: Dict[str, List[Token]] = {}
+        # Encode in chunks, so we never hold the huggingface output for all of the texts at once.
+        for text_batch in lazy_groups_of(unique_texts, self._BATCH_ENCODE_SIZE):
+            encoded_batch = self.tokenizer.batch_encode_plus(
+                text_batch, **self._encode_plus_kwargs()
+            )
+            offsets_batch = encoded_batch.get("offset_mapping")
+            for i, text in enumerate(text_batch):
+                tokens_by_text[text] = self._tokens_from_encoding(
+                    text,
+                    encoded_batch["input_ids"][i],
+                    encoded_batch["token_type_ids"][i],
+                    encoded_batch["special_tokens_mask"][i],
+                    None if offsets_batch is None else offsets_batch[i],
+                )
+        batch_tokens: List[List[Token]] = []
+        seen_texts: Set[str] = set()
+        for text in texts:
+            tokens = tokens_by_text[text]
+            if text in seen_texts:
+                # `Token` is mutable, so repeated texts get copies rather than shared tokens.
+                tokens = [dataclasses.replace(token) for token in tokens]
+            else:
+                seen_texts.add(text)
+            batch_tokens.append(tokens)
+        return batch_tokens
+
     @overrides
     def tokenize(self, text: str) -> List[Token]:
         """
         This method only handles a single sentence (or sequence) of text.
         """
-        max_length = self._max_length
-        if max_length is not None and not self._add_special_tokens:
-            max_length += self.num_special_tokens_for_sequence()
-
-        encoded_tokens = self.tokenizer.encode_plus(
-            text=text,
-            add_special_tokens=True,
-            max_length=max_length,
-            truncation=True if max_length is not None else False,
-            return_tensors=None,
-            return_offsets_mapping=self.tokenizer.is_fast,
-            return_attention_mask=False,
-            return_token_type_ids=True,
-            return_special_tokens_mask=True,
-        )
+        encoded_tokens = self.tokenizer.encode_plus(text=text, **self._encode_plus_kwargs())
         # token_ids contains a final list with ids for both regular and special tokens
-        token_ids, token_type_ids, special_tokens_mask, token_offsets = (
+        return self._tokens_from_encoding(
+            text,
             encoded_tokens["input_ids"],
             encoded_tokens["token_type_ids"],
             encoded_tokens["special_tokens_mask"],
             encoded_tokens.get("offset_mapping"),
         )
 
+    def _tokens_from_encoding(
+        self,
+        text: str,
+        token_ids: List[int],
+        token_type_ids: List[int],
+        special_tokens_mask: List[int],
+        token_offsets: Optional[List[Optional[Tuple[int, int]]]],
+    ) -> List[Token]:
         # If we don't have token offsets, try to calculate them ourselves.
         if token_offsets is None:
             token_offsets = self._estimate_character_indices(text, token_ids)
@@ -350,15 +402,22 @@ class PretrainedTransformerTokenizer(Tokenizer):
     ) -> Tuple[List[Token], List[Optional[Tuple[int, int]]]]:
         tokens: List[Token] = []
         offsets: List[Optional[Tuple[int, int]]] = []
+        if len(string_tokens) == 0:
+            return tokens, offsets
+
+        # Words repeat a lot within a text, so we encode every distinct word only once, and we
+        # do it with a single batched call.
+        unique_token_strings = list(dict.fromkeys(string_tokens))
+        wordpieces = self.tokenizer.batch_encode_plus(
+            unique_token_strings,
+            add_special_tokens=False,
+            return_tensors=None,
+            return_offsets_mapping=False,
+            return_attention_mask=False,
+        )
+        wp_ids_by_token_string = dict(zip(unique_token_strings, wordpieces["input_ids"]))
         for token_string in string_tokens:
-            wordpieces = self.tokenizer.encode_plus(
-                token_string,
-                add_special_tokens=False,
-                return_tensors=None,
-                return_offsets_mapping=False,
-                return_attention_mask=False,
-            )
-            wp_ids = wordpieces["input_ids"]
+            wp_ids = wp_ids_by_token_string[token_string]
 
             if len(wp_ids) > 0:
                 offsets.append((len(tokens), len(tokens) + len(wp_ids) - 1))
@@ -8,7 +8,7 @@ import warnings
 import torch
 import torch.distributed as dist
 
-from allennlp.common.util import is_distributed, is_global_primary
+from allennlp.common.util import is_distributed, is_global_primary, is_local_primary
 from allennlp.nn.parallel import ShardedModuleMixin
 from allennlp.nn.module import Module
 from allennlp.nn.util import (
@@ -245,9 +245,9 @@ class TransformerModule(Module):
         **kwargs : `Any`
             Key word arguments to pass to `cls.from_config()` when instantiating the module.
         """  # noqa: E501
-        from transformers import AutoConfig
-
-        config = AutoConfig.from_pretrained(model_name, **(auto_config_kwargs or {}))
+        config = _get_pretrained_config(
+            model_name, auto_config_kwargs or {}, synchronize=load_weights
+        )
         model = cls._from_config(config, **kwargs)
 
         if load_weights:
@@ -296,6 +296,38 @@ class TransformerModule(Module):
         return model
 
 
+def _get_pretrained_config(
+    model_name: str, auto_config_kwargs: Dict[str, Any], synchronize: bool
+) -> "PretrainedConfig":
+    from transformers import AutoConfig
+
+    # We only synchronize when every process is going to hit a barrier anyway, i.e. when loading
+    # weights in distributed training. Otherwise this could hang callers that build a module on
+    # some processes only.
+    if not (synchronize and is_distributed()):
+        return AutoConfig.from_pretrained(model_name, **auto_config_kwargs)
+
+    # Let the primary process of each node fetch the config first, so the other processes on that
+    # node can read it from the local cache without going to the HuggingFace Hub.
+    if is_local_primary():
+        try:
+            return AutoConfig.from_pretrained(model_name, **auto_config_kwargs)
+        finally:
+            # Release the other processes even if this failed, so they fail on their own
+            # instead of waiting forever.
+            dist.barrier()
+
+    dist.barrier()
+    try:
+        return AutoConfig.from_pretrained(
+            model_name, **{**auto_config_kwargs, "local_files_only": True}
+        )
+    except (OSError, ValueError):
+        # The config is not in this process's cache, e.g. because the cache directory
+        # is not shared with the local primary.
+        return AutoConfig.from_pretrained(model_name, **auto_config_kwargs)
+
+
 def _get_mapped_state_dict(
     module: torch.nn.Module,
     state_dict: StateDictType,
@@ -1,5 +1,5 @@
 import re
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import torch
 
@@ -22,6 +22,21 @@ class RegularizerApplicator(FromParams):
             been matched).
         """
         self._regularizers = regexes or []
+        # Parameter names don't change between calls, so we only match each name once.
+        self._regularizer_for_name: Dict[str, Optional[Regularizer]] = {}
+
+    def _find_regularizer(self, name: str) -> Optional[Regularizer]:
+        if name not in self._regularizer_for_name:
+            # For each parameter find the first matching regex.
+            self._regularizer_for_name[name] = next(
+                (
+                    regularizer
+                    for regex, regularizer in self._regularizers
+                    if re.search(regex, name)
+                ),
+                None,
+            )
+        return self._regularizer_for_name[name]
 
     def __call__(self, module: torch.nn.Module) -> torch.Tensor:
         """
@@ -34,10 +49,8 @@ class RegularizerApplicator(FromParams):
         for name, parameter in module.named_parameters():
             # We first check if the parameter needs gradient updates or not
             if parameter.requires_grad:
-                # For each parameter find the first matching regex.
-                for regex, regularizer in self._regularizers:
-                    if re.search(regex, name):
-                        penalty = regularizer(parameter)
-                        accumulator = accumulator + penalty
-                        break
+                regularizer = self._find_regularizer(name)
+                if regularizer is not None:
+                    penalty = regularizer(parameter)
+                    accumulator = accumulator + penalty
         return accumulator
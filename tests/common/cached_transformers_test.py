@@ -114,3 +114,14 @@ class TestCachedTransformers(AllenNlpTestCase):
                 cache_dir=self.TEST_DIR,
                 local_files_only=True,
             )
+
+    def test_get_tokenizer_kwargs_order_does_not_matter(self):
+        tokenizer = cached_transformers.get_tokenizer(
+            "bert-base-uncased", use_fast=True, add_special_tokens=False
+        )
+        assert (
+            cached_transformers.get_tokenizer(
+                "bert-base-uncased", add_special_tokens=False, use_fast=True
+            )
+            is tokenizer
+        )
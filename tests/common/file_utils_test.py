@@ -157,6 +157,20 @@ class TestFileUtils(AllenNlpTestCase):
 
         assert get_from_cache(url, cache_dir=self.TEST_DIR) == filename
 
+    @responses.activate
+    def test_get_from_cache_prefer_cached(self, monkeypatch):
+        url = "http://fake.datastore.com/glove.txt.gz"
+        set_up_glove(url, self.glove_bytes, change_etag_every=1)
+
+        filename = get_from_cache(url, cache_dir=self.TEST_DIR)
+        assert len(responses.calls) == 2
+
+        # With `PREFER_CACHED`, the cached copy is used even though the ETag would have changed,
+        # and we don't make any more requests.
+        monkeypatch.setattr(file_utils, "PREFER_CACHED", True)
+        assert get_from_cache(url, cache_dir=self.TEST_DIR) == filename
+        assert len(responses.calls) == 2
+
     def test_resource_to_filename(self):
         for url in [
             "http://allenai.org",
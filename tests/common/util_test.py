@@ -192,3 +192,37 @@ def test_format_size(size: int, result: str):
 )
 def test_format_timedelta(td: timedelta, result: str):
     assert util.format_timedelta(td) == result
+
+
+def test_is_local_primary_not_distributed(monkeypatch):
+    monkeypatch.setattr(util, "is_distributed", lambda: False)
+    monkeypatch.setenv("LOCAL_RANK", "1")
+    assert util.is_local_primary()
+
+
+@pytest.mark.parametrize("local_rank, result", [("0", True), ("1", False)])
+def test_is_local_primary_from_local_rank(monkeypatch, local_rank: str, result: bool):
+    monkeypatch.setattr(util, "is_distributed", lambda: True)
+    monkeypatch.setenv("LOCAL_RANK", local_rank)
+    # `LOCAL_RANK` takes precedence over the global rank.
+    monkeypatch.setattr(util.dist, "get_rank", lambda: 5)
+    assert util.is_local_primary() == result
+
+
+@pytest.mark.parametrize("rank, result", [(0, True), (2, True), (3, False)])
+def test_is_local_primary_from_procs_per_node(monkeypatch, rank: int, result: bool):
+    monkeypatch.setattr(util, "is_distributed", lambda: True)
+    monkeypatch.delenv("LOCAL_RANK", raising=False)
+    monkeypatch.setenv("ALLENNLP_PROCS_PER_NODE", "2")
+    monkeypatch.setattr(util.dist, "get_rank", lambda: rank)
+    assert util.is_local_primary() == result
+
+
+@pytest.mark.parametrize("rank, result", [(0, True), (3, False)])
+def test_is_local_primary_defaults_to_world_size(monkeypatch, rank: int, result: bool):
+    monkeypatch.setattr(util, "is_distributed", lambda: True)
+    monkeypatch.delenv("LOCAL_RANK", raising=False)
+    monkeypatch.delenv("ALLENNLP_PROCS_PER_NODE", raising=False)
+    monkeypatch.setattr(util.dist, "get_rank", lambda: rank)
+    monkeypatch.setattr(util.dist, "get_world_size", lambda: 4)
+    assert util.is_local_primary() == result
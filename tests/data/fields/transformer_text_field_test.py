@@ -42,7 +42,41 @@ def test_transformer_text_field_batching():
     assert torch.all(tensors["text"]["attention_mask"][-1] == torch.tensor([False]))
 
 
-@pytest.mark.parametrize("return_tensors", ["pt", None])
+def test_transformer_text_field_single_instance_as_tensor_dict():
+    field = TransformerTextField(torch.IntTensor([[1, 2, 3]]), token_type_ids=[0, 0, 1])
+    tensors = Instance({"text": field}).as_tensor_dict()
+    assert torch.all(tensors["text"]["input_ids"] == torch.IntTensor([1, 2, 3]))
+    assert torch.all(tensors["text"]["token_type_ids"] == torch.tensor([0, 0, 1]))
+    assert torch.all(tensors["text"]["attention_mask"] == torch.BoolTensor([True, True, True]))
+    # No padding is needed, so the input ids are a view of the field's own tensor.
+    assert tensors["text"]["input_ids"].data_ptr() == field.input_ids.data_ptr()
+
+
+def test_transformer_text_field_full_attention_mask():
+    field = TransformerTextField(torch.IntTensor([1, 2, 3]), attention_mask=[1, 1, 1])
+    assert field.attention_mask is None
+    assert field.get_padding_lengths()["attention_mask"] == 3
+    assert field.human_readable_repr()["attention_mask"] == "[True, True, True]"
+
+
+@pytest.mark.parametrize("full_mask_first", [True, False])
+def test_transformer_text_field_batching_mixed_attention_masks(full_mask_first):
+    full_mask_field = TransformerTextField(
+        torch.IntTensor([1, 2, 3, 4]), attention_mask=[1, 1, 1, 1]
+    )
+    padded_field = TransformerTextField(torch.IntTensor([1, 2, 0]), attention_mask=[1, 1, 0])
+    fields = [full_mask_field, padded_field]
+    expected_masks = [[True, True, True, True], [True, True, False, False]]
+    if not full_mask_first:
+        fields.reverse()
+        expected_masks.reverse()
+
+    batch = Batch([Instance({"text": field}) for field in fields])
+    tensors = batch.as_tensor_dict(batch.get_padding_lengths())
+    assert torch.all(tensors["text"]["attention_mask"] == torch.BoolTensor(expected_masks))
+
+
+@pytest.mark.parametrize("return_tensors", ["pt", "np", None])
 def test_transformer_text_field_from_huggingface(return_tensors):
     tokenizer = get_tokenizer("bert-base-cased")
 
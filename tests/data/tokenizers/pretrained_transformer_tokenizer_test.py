@@ -157,6 +157,30 @@ class TestPretrainedTransformerTokenizer(AllenNlpTestCase):
         tokens = tokenizer.tokenize(" ".join(["a"] * 550))
         assert len(tokens) == 550
 
+    def test_batch_tokenize(self):
+        tokenizer = PretrainedTransformerTokenizer("bert-base-cased")
+        texts = [
+            "AllenNLP is great.",
+            "Hello, World!",
+            "AllenNLP is great.",
+        ]
+        batch_tokens = tokenizer.batch_tokenize(texts)
+        assert len(batch_tokens) == len(texts)
+        for text, tokens in zip(texts, batch_tokens):
+            expected = tokenizer.tokenize(text)
+            assert [t.text for t in tokens] == [t.text for t in expected]
+            assert [t.idx for t in tokens] == [t.idx for t in expected]
+            assert [t.type_id for t in tokens] == [t.type_id for t in expected]
+        assert batch_tokens[0] is not batch_tokens[2]
+        assert batch_tokens[0][0] is not batch_tokens[2][0]
+        assert tokenizer.batch_tokenize([]) == []
+
+        # Encoding in several chunks gives the same result.
+        tokenizer._BATCH_ENCODE_SIZE = 1
+        assert [[t.text for t in tokens] for tokens in tokenizer.batch_tokenize(texts)] == [
+            [t.text for t in tokens] for tokens in batch_tokens
+        ]
+
     def test_token_idx_roberta(self):
         sentence = "A, naïve <mask> AllenNLP sentence."
         expected_tokens = [